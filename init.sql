@@ -6,6 +6,7 @@
 
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Create initial admin user (password: admin123)
 -- This will be created by the application on first run
@@ -0,0 +1,130 @@
+"""initial schema
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2025-07-12 00:00:00.000000
+
+Databases that were created by ``Base.metadata.create_all`` before migrations
+were introduced already match this revision; mark them with
+``alembic stamp 0001_initial_schema`` instead of running it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_initial_schema'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(), nullable=True),
+        sa.Column('username', sa.String(), nullable=True),
+        sa.Column('hashed_password', sa.String(), nullable=True),
+        sa.Column('full_name', sa.String(), nullable=True),
+        sa.Column('role', sa.Enum('ADMIN', 'AGENT', 'INVESTOR', name='userrole'), nullable=True),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+
+    op.create_table(
+        'properties',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('address', sa.String(), nullable=True),
+        sa.Column('city', sa.String(), nullable=True),
+        sa.Column('state', sa.String(), nullable=True),
+        sa.Column('zip_code', sa.String(), nullable=True),
+        sa.Column('property_type', sa.String(), nullable=True),
+        sa.Column('square_feet', sa.Float(), nullable=True),
+        sa.Column('bedrooms', sa.Integer(), nullable=True),
+        sa.Column('bathrooms', sa.Float(), nullable=True),
+        sa.Column('year_built', sa.Integer(), nullable=True),
+        sa.Column('arv', sa.Float(), nullable=True),
+        sa.Column('purchase_price', sa.Float(), nullable=True),
+        sa.Column('repair_cost', sa.Float(), nullable=True),
+        sa.Column('holding_cost', sa.Float(), nullable=True),
+        sa.Column('selling_price', sa.Float(), nullable=True),
+        sa.Column('status', sa.Enum('AVAILABLE', 'UNDER_CONTRACT', 'SOLD', 'OFF_MARKET', name='propertystatus'), nullable=True),
+        sa.Column('list_date', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('sold_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('owner_id', sa.Integer(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_properties_id', 'properties', ['id'])
+    op.create_index('ix_properties_address', 'properties', ['address'])
+
+    op.create_table(
+        'leads',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(), nullable=True),
+        sa.Column('last_name', sa.String(), nullable=True),
+        sa.Column('email', sa.String(), nullable=True),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('address', sa.String(), nullable=True),
+        sa.Column('city', sa.String(), nullable=True),
+        sa.Column('state', sa.String(), nullable=True),
+        sa.Column('zip_code', sa.String(), nullable=True),
+        sa.Column('property_type', sa.String(), nullable=True),
+        sa.Column('estimated_value', sa.Float(), nullable=True),
+        sa.Column('reason_for_selling', sa.String(), nullable=True),
+        sa.Column('timeline', sa.String(), nullable=True),
+        sa.Column('status', sa.Enum('NEW', 'CONTACTED', 'INTERESTED', 'NOT_INTERESTED', 'CONVERTED', name='leadstatus'), nullable=True),
+        sa.Column('assigned_to_id', sa.Integer(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('next_follow_up', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['assigned_to_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_leads_id', 'leads', ['id'])
+
+    op.create_table(
+        'deals',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('property_id', sa.Integer(), nullable=True),
+        sa.Column('lead_id', sa.Integer(), nullable=True),
+        sa.Column('agent_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', 'CLOSED', name='dealstatus'), nullable=True),
+        sa.Column('offer_price', sa.Float(), nullable=True),
+        sa.Column('closing_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('wholesale_fee', sa.Float(), nullable=True),
+        sa.Column('net_profit', sa.Float(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['agent_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['lead_id'], ['leads.id']),
+        sa.ForeignKeyConstraint(['property_id'], ['properties.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_deals_id', 'deals', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('deals')
+    op.drop_table('leads')
+    op.drop_table('properties')
+    op.drop_table('users')
+    sa.Enum(name='dealstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='leadstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='propertystatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='userrole').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,41 @@
+"""partial indexes for dashboard status filters
+
+Revision ID: 0002_status_partial_indexes
+Revises: 0001_initial_schema
+Create Date: 2025-07-20 00:00:00.000000
+
+Indexes are built CONCURRENTLY so existing tables stay writable; IF NOT EXISTS
+keeps the revision safe on databases where create_all already built them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_status_partial_indexes'
+down_revision: Union[str, None] = '0001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_properties_status_available", "properties", "status", "status = 'AVAILABLE'"),
+    ("ix_leads_status_new", "leads", "status", "status = 'NEW'"),
+    ("ix_deals_status_pending", "deals", "status", "status = 'PENDING'"),
+    ("ix_deals_closed_created_at", "deals", "created_at", "status = 'CLOSED'"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column, predicate in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({column}) WHERE {predicate}"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,52 @@
+"""trigram GIN indexes for free-text search
+
+Revision ID: 0003_trigram_search_indexes
+Revises: 0002_status_partial_indexes
+Create Date: 2025-07-21 00:00:00.000000
+
+The index expressions must stay identical to the search_text() expressions in
+app/models.py, otherwise the planner will not use them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_trigram_search_indexes'
+down_revision: Union[str, None] = '0002_status_partial_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (
+        "ix_leads_name_trgm", "leads",
+        "((coalesce(first_name, '') || ' ') || coalesce(last_name, ''))",
+    ),
+    (
+        "ix_leads_search_trgm", "leads",
+        "((((((((coalesce(first_name, '') || ' ') || coalesce(last_name, '')) || ' ') "
+        "|| coalesce(email, '')) || ' ') || coalesce(address, '')) || ' ') || coalesce(city, ''))",
+    ),
+    ("ix_properties_address_trgm", "properties", "address"),
+    (
+        "ix_properties_search_trgm", "properties",
+        "((((coalesce(address, '') || ' ') || coalesce(city, '')) || ' ') || coalesce(state, ''))",
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, table, expression in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({expression} gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
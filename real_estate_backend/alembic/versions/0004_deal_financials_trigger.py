@@ -0,0 +1,51 @@
+"""compute deal financials with a trigger
+
+Revision ID: 0004_deal_financials_trigger
+Revises: 0003_trigram_search_indexes
+Create Date: 2025-07-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_deal_financials_trigger'
+down_revision: Union[str, None] = '0003_trigram_search_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION deals_calc_financials() RETURNS trigger AS $$
+        DECLARE
+            property_arv double precision;
+            property_purchase_price double precision;
+        BEGIN
+            SELECT arv, purchase_price INTO property_arv, property_purchase_price
+            FROM properties WHERE id = NEW.property_id;
+
+            IF COALESCE(property_arv, 0) <> 0 AND NEW.offer_price IS NOT NULL THEN
+                NEW.wholesale_fee := property_arv * 0.10;
+                NEW.net_profit := NEW.wholesale_fee - (NEW.offer_price - property_purchase_price);
+            ELSIF TG_OP = 'INSERT' THEN
+                NEW.wholesale_fee := NULL;
+                NEW.net_profit := NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS deals_calc_financials ON deals")
+    op.execute("""
+        CREATE TRIGGER deals_calc_financials
+        BEFORE INSERT OR UPDATE OF offer_price, property_id ON deals
+        FOR EACH ROW EXECUTE FUNCTION deals_calc_financials()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS deals_calc_financials ON deals")
+    op.execute("DROP FUNCTION IF EXISTS deals_calc_financials()")
@@ -0,0 +1,37 @@
+"""(created_at, id) indexes for keyset pagination
+
+Revision ID: 0005_keyset_pagination_indexes
+Revises: 0004_deal_financials_trigger
+Create Date: 2025-07-23 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_keyset_pagination_indexes'
+down_revision: Union[str, None] = '0004_deal_financials_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_properties_created_at_id", "properties"),
+    ("ix_leads_created_at_id", "leads"),
+    ("ix_deals_created_at_id", "deals"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} (created_at, id)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
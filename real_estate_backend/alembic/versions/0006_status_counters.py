@@ -0,0 +1,75 @@
+"""trigger-maintained status counters
+
+Revision ID: 0006_status_counters
+Revises: 0005_keyset_pagination_indexes
+Create Date: 2025-07-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_status_counters'
+down_revision: Union[str, None] = '0005_keyset_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENTITIES = [
+    ("property", "properties"),
+    ("lead", "leads"),
+    ("deal", "deals"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'status_counters',
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('n', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('entity', 'status'),
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION status_counters_track() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status IS NOT NULL THEN
+                UPDATE status_counters SET n = n - 1
+                WHERE entity = TG_ARGV[0] AND status = OLD.status::text;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status IS NOT NULL THEN
+                INSERT INTO status_counters (entity, status, n)
+                VALUES (TG_ARGV[0], NEW.status::text, 1)
+                ON CONFLICT (entity, status) DO UPDATE SET n = status_counters.n + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for entity, table in ENTITIES:
+        # Lock out writers so the backfill and the new triggers agree
+        op.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+        op.execute(
+            f"CREATE TRIGGER {table}_status_counts AFTER INSERT OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION status_counters_track('{entity}')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_status_counts_update AFTER UPDATE OF status ON {table} "
+            f"FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) "
+            f"EXECUTE FUNCTION status_counters_track('{entity}')"
+        )
+        op.execute(
+            f"INSERT INTO status_counters (entity, status, n) "
+            f"SELECT '{entity}', status::text, count(*) FROM {table} "
+            f"WHERE status IS NOT NULL GROUP BY status"
+        )
+
+
+def downgrade() -> None:
+    for _, table in ENTITIES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_status_counts_update ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_status_counts ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS status_counters_track()")
+    op.drop_table('status_counters')
@@ -0,0 +1,92 @@
+"""store role and status columns as checked strings
+
+Revision ID: 0007_enum_columns_as_strings
+Revises: 0006_status_counters
+Create Date: 2025-07-25 00:00:00.000000
+
+The native enum types stored member names ('AVAILABLE'); the VARCHAR columns
+store the enum values ('available'), so data, partial index predicates and
+status counters are rewritten with lower()/upper().
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_enum_columns_as_strings'
+down_revision: Union[str, None] = '0006_status_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    ("users", "role", "userrole", ["admin", "agent", "investor"]),
+    ("properties", "status", "propertystatus",
+     ["available", "under_contract", "sold", "off_market"]),
+    ("leads", "status", "leadstatus",
+     ["new", "contacted", "interested", "not_interested", "converted"]),
+    ("deals", "status", "dealstatus", ["pending", "approved", "rejected", "closed"]),
+]
+
+PARTIAL_INDEXES = [
+    ("ix_properties_status_available", "properties", "status", "available"),
+    ("ix_leads_status_new", "leads", "status", "new"),
+    ("ix_deals_status_pending", "deals", "status", "pending"),
+    ("ix_deals_closed_created_at", "deals", "created_at", "closed"),
+]
+
+# Triggers with a column list or WHEN clause on status block ALTER COLUMN TYPE
+STATUS_TRIGGERS = [
+    ("property", "properties"),
+    ("lead", "leads"),
+    ("deal", "deals"),
+]
+
+
+def _drop_status_dependents() -> None:
+    for name, _, _, _ in PARTIAL_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    for _, table in STATUS_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_status_counts_update ON {table}")
+
+
+def _create_status_dependents(as_value) -> None:
+    for name, table, column, value in PARTIAL_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} ({column}) WHERE status = {as_value(value)}")
+    for entity, table in STATUS_TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {table}_status_counts_update AFTER UPDATE OF status ON {table} "
+            f"FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) "
+            f"EXECUTE FUNCTION status_counters_track('{entity}')"
+        )
+
+
+def upgrade() -> None:
+    _drop_status_dependents()
+    for table, column, enum_name, values in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) "
+            f"USING lower({column}::text)"
+        )
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_{column} "
+            f"CHECK ({column} IN ({allowed}))"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+    _create_status_dependents(lambda value: f"'{value}'")
+    op.execute("UPDATE status_counters SET status = lower(status)")
+
+
+def downgrade() -> None:
+    _drop_status_dependents()
+    for table, column, enum_name, values in COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_{table}_{column}")
+        names = ", ".join(f"'{value.upper()}'" for value in values)
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({names})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_name} "
+            f"USING upper({column})::{enum_name}"
+        )
+    _create_status_dependents(lambda value: f"'{value.upper()}'")
+    op.execute("UPDATE status_counters SET status = upper(status)")
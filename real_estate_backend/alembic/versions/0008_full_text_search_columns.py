@@ -0,0 +1,74 @@
+"""generated tsvector columns for list search
+
+Revision ID: 0008_full_text_search_columns
+Revises: 0007_enum_columns_as_strings
+Create Date: 2025-07-26 00:00:00.000000
+
+The list endpoints' ?search= filter now matches search_tsv, so the trigram
+indexes over the concatenated search text are dropped. The name and address
+trigram indexes stay for the /search/ endpoints.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_full_text_search_columns'
+down_revision: Union[str, None] = '0007_enum_columns_as_strings'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = [
+    (
+        "properties",
+        "to_tsvector('simple', coalesce(address, '') || ' ' || coalesce(city, '') "
+        "|| ' ' || coalesce(state, ''))",
+    ),
+    (
+        "leads",
+        "to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') "
+        "|| ' ' || coalesce(email, '') || ' ' || coalesce(address, '') || ' ' || coalesce(city, ''))",
+    ),
+]
+
+TRIGRAM_INDEXES = [
+    (
+        "ix_leads_search_trgm", "leads",
+        "((((((((coalesce(first_name, '') || ' ') || coalesce(last_name, '')) || ' ') "
+        "|| coalesce(email, '')) || ' ') || coalesce(address, '')) || ' ') || coalesce(city, ''))",
+    ),
+    (
+        "ix_properties_search_trgm", "properties",
+        "((((coalesce(address, '') || ' ') || coalesce(city, '')) || ' ') || coalesce(state, ''))",
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, expression in SEARCH_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+    with op.get_context().autocommit_block():
+        for table, _ in SEARCH_COLUMNS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_tsv "
+                f"ON {table} USING gin (search_tsv)"
+            )
+        for name, _, _ in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, expression in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({expression} gin_trgm_ops)"
+            )
+        for table, _ in SEARCH_COLUMNS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_tsv")
+    for table, _ in SEARCH_COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_tsv")
@@ -0,0 +1,49 @@
+"""clear deal financials on update when they cannot be computed
+
+Revision ID: 0009_deal_financials_on_update
+Revises: 0008_full_text_search_columns
+Create Date: 2025-07-27 00:00:00.000000
+
+deals_calc_financials only cleared wholesale_fee and net_profit on INSERT, so
+an update (including POST /deals/recalculate) left stale values behind once
+the property's ARV or the deal's offer price had been removed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_deal_financials_on_update'
+down_revision: Union[str, None] = '0008_full_text_search_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FUNCTION = """
+    CREATE OR REPLACE FUNCTION deals_calc_financials() RETURNS trigger AS $$
+    DECLARE
+        property_arv double precision;
+        property_purchase_price double precision;
+    BEGIN
+        SELECT arv, purchase_price INTO property_arv, property_purchase_price
+        FROM properties WHERE id = NEW.property_id;
+
+        IF COALESCE(property_arv, 0) <> 0 AND NEW.offer_price IS NOT NULL THEN
+            NEW.wholesale_fee := property_arv * 0.10;
+            NEW.net_profit := NEW.wholesale_fee - (NEW.offer_price - property_purchase_price);
+        {otherwise}
+            NEW.wholesale_fee := NULL;
+            NEW.net_profit := NULL;
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(FUNCTION.format(otherwise="ELSE"))
+
+
+def downgrade() -> None:
+    op.execute(FUNCTION.format(otherwise="ELSIF TG_OP = 'INSERT' THEN"))
@@ -0,0 +1,116 @@
+import functools
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+import orjson
+import redis.asyncio as redis
+from fastapi import Request, Response
+from pydantic import BaseModel
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_PREFIX = "re-api:dashboard:"
+# Bumped on every write; cached bodies are stored under the current version, so
+# invalidation is a single INCR and superseded entries simply expire
+DASHBOARD_VERSION_KEY = f"{DASHBOARD_PREFIX}ver"
+
+_redis: Optional[redis.Redis] = None
+
+# Per-worker copy of recent responses, checked before Redis. Other workers only
+# see invalidations through Redis, so local entries live for a few seconds at most.
+LOCAL_TTL_SECONDS = 5
+LOCAL_MAX_ENTRIES = 1024
+
+_local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+def _local_get(key: str) -> Optional[bytes]:
+    entry = _local.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at < time.monotonic():
+        del _local[key]
+        return None
+    _local.move_to_end(key)
+    return body
+
+def _local_set(key: str, body: bytes, ttl_seconds: int):
+    _local[key] = (time.monotonic() + min(ttl_seconds, LOCAL_TTL_SECONDS), body)
+    _local.move_to_end(key)
+    if len(_local) > LOCAL_MAX_ENTRIES:
+        _local.popitem(last=False)
+
+async def init_cache():
+    global _redis
+    if settings.REDIS_URL:
+        _redis = redis.from_url(settings.REDIS_URL)
+
+async def close_cache():
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+def _encode(result) -> bytes:
+    # The cached Response bypasses CompactRoute, so drop None fields here too
+    if isinstance(result, BaseModel):
+        return result.model_dump_json(exclude_none=True).encode()
+    return orjson.dumps(result)
+
+def request_key(request: Request, user) -> str:
+    # The dashboard figures are the same for every user, so they share one entry
+    return f"{request.url.path}?{request.url.query}"
+
+async def _versioned_key(key: str) -> str:
+    version = await _redis.get(DASHBOARD_VERSION_KEY)
+    return f"{DASHBOARD_PREFIX}{int(version or 0)}:{key}"
+
+def cache_config(ttl_seconds: int = 300, key_builder=request_key):
+    """Cache a dashboard route's JSON body, keyed on path and query string.
+
+    Bodies are kept briefly in this worker and for ``ttl_seconds`` in Redis. The
+    decorated route must accept ``request: Request`` and ``current_user``
+    arguments; ``key_builder`` receives both. When Redis is not configured or
+    unreachable only the local copy is used.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            key = key_builder(request, kwargs["current_user"])
+
+            cached = _local_get(key)
+            redis_key = None
+            if cached is None and _redis is not None:
+                try:
+                    redis_key = await _versioned_key(key)
+                    cached = await _redis.get(redis_key)
+                except redis.RedisError:
+                    logger.warning("Cache read failed for %s", key, exc_info=True)
+                if cached is not None:
+                    _local_set(key, cached, ttl_seconds)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+            body = _encode(await func(*args, **kwargs))
+            _local_set(key, body, ttl_seconds)
+
+            if redis_key is not None:
+                try:
+                    await _redis.set(redis_key, body, ex=ttl_seconds)
+                except redis.RedisError:
+                    logger.warning("Cache write failed for %s", key, exc_info=True)
+            return Response(content=body, media_type="application/json")
+        return wrapper
+    return decorator
+
+async def invalidate_dashboard():
+    _local.clear()
+    if _redis is None:
+        return
+    try:
+        await _redis.incr(DASHBOARD_VERSION_KEY)
+    except redis.RedisError:
+        logger.warning("Dashboard cache invalidation failed", exc_info=True)
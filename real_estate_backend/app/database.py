@@ -1,16 +1,45 @@
-from sqlalchemy import create_engine
+import asyncio
+import logging
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# DATABASE_URL stays a plain postgresql:// URL (used as-is by Alembic); the app
+# talks to the same database through the asyncpg driver
+engine = create_async_engine(
+    make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # No SELECT 1 on every checkout; keep_pool_alive() pings in the background
+    pool_pre_ping=False
+)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+logger = logging.getLogger(__name__)
+
+async def _ping():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def warm_pool():
+    """Open DB_POOL_SIZE connections up front so early requests skip the handshake."""
+    await asyncio.gather(*(_ping() for _ in range(settings.DB_POOL_SIZE)))
+
+async def keep_pool_alive(interval_seconds: int = 60):
+    """Ping the database periodically so idle pooled connections are not dropped."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await _ping()
+        except Exception:
+            logger.warning("Database keepalive failed", exc_info=True)
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close() 
\ No newline at end of file
@@ -0,0 +1,100 @@
+import hashlib
+from typing import Dict, Iterable
+from starlette.middleware.cors import CORSMiddleware
+
+def _if_none_match(scope) -> set:
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            return {tag.strip().removeprefix("W/") for tag in value.decode("latin-1").split(",")}
+    return set()
+
+class StaticETagMiddleware:
+    """Add ETag and Cache-Control to GET responses whose body never changes.
+
+    The ETag of each path is computed from its first 200 response and kept for
+    the life of the process; later requests carrying a matching If-None-Match
+    get a 304 without reaching the route. The tag is weak because GZip sits
+    outside this middleware, so one tag covers every content-coding.
+    """
+
+    def __init__(self, app, paths: Iterable[str], max_age: int = 60):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.cache_control = f"public, max-age={max_age}".encode()
+        self.etags: Dict[str, str] = {}
+
+    def _headers(self, start, etag: str):
+        headers = [
+            (name, value) for name, value in start["headers"]
+            if name not in (b"etag", b"cache-control")
+        ]
+        headers += [(b"etag", etag.encode()), (b"cache-control", self.cache_control)]
+        return {**start, "headers": headers}
+
+    def _not_modified(self, etag: str):
+        return {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", etag.encode()), (b"cache-control", self.cache_control)],
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        etag = self.etags.get(path)
+        if etag is not None:
+            if etag.removeprefix("W/") in _if_none_match(scope):
+                await send(self._not_modified(etag))
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            async def tag(message):
+                if message["type"] == "http.response.start" and message["status"] == 200:
+                    message = self._headers(message, etag)
+                await send(message)
+
+            await self.app(scope, receive, tag)
+            return
+
+        # First request for this path: these bodies are small, so buffer the
+        # response to hash it
+        start = None
+        chunks = []
+
+        async def capture(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+
+        if start["status"] == 200:
+            etag = 'W/"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+            self.etags[path] = etag
+            if etag.removeprefix("W/") in _if_none_match(scope):
+                await send(self._not_modified(etag))
+                await send({"type": "http.response.body", "body": b""})
+                return
+            start = self._headers(start, etag)
+
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+class OriginCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that hands requests without an Origin header straight to the app.
+
+    Same-origin and non-browser traffic never needs CORS handling, so the check
+    is done on the raw ASGI headers before Starlette builds a Headers object.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
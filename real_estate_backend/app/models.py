@@ -1,5 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, Boolean, Text, ForeignKey, CheckConstraint, Computed, Index, DDL, FetchedValue, event, literal, literal_column, text
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from .database import Base
 import enum
@@ -28,6 +30,29 @@ class DealStatus(str, enum.Enum):
     REJECTED = "rejected"
     CLOSED = "closed"
 
+class EnumString(TypeDecorator):
+    """Store a str enum as its plain value in a short VARCHAR.
+
+    Values are validated against the enum when bound; rows are returned as the
+    stored strings, which compare equal to the (str) enum members, so result
+    hydration needs no per-row conversion.
+    """
+    impl = String(16)
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value).value
+
+def enum_check(table: str, column: str, enum_class) -> CheckConstraint:
+    values = ", ".join(f"'{member.value}'" for member in enum_class)
+    return CheckConstraint(f"{column} IN ({values})", name=f"ck_{table}_{column}")
+
 class User(Base):
     __tablename__ = "users"
     
@@ -36,7 +61,7 @@ class User(Base):
     username = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     full_name = Column(String)
-    role = Column(Enum(UserRole), default=UserRole.AGENT)
+    role = Column(EnumString(UserRole), default=UserRole.AGENT)
     phone = Column(String)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -46,6 +71,10 @@ class User(Base):
     properties = relationship("Property", back_populates="owner")
     leads = relationship("Lead", back_populates="assigned_to")
     deals = relationship("Deal", back_populates="agent")
+    
+    __table_args__ = (
+        enum_check('users', 'role', UserRole),
+    )
 
 class Property(Base):
     __tablename__ = "properties"
@@ -69,7 +98,7 @@ class Property(Base):
     selling_price = Column(Float)
     
     # Status and dates
-    status = Column(Enum(PropertyStatus), default=PropertyStatus.AVAILABLE)
+    status = Column(EnumString(PropertyStatus), default=PropertyStatus.AVAILABLE)
     list_date = Column(DateTime(timezone=True), server_default=func.now())
     sold_date = Column(DateTime(timezone=True))
     
@@ -82,6 +111,24 @@ class Property(Base):
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Full-text search document, maintained by Postgres
+    search_tsv = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('simple', coalesce(address, '') || ' ' || coalesce(city, '') "
+        "|| ' ' || coalesce(state, ''))",
+        persisted=True
+    )))
+    
+    # Fetch updated_at with UPDATE ... RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        enum_check('properties', 'status', PropertyStatus),
+        Index('ix_properties_status_available', 'status',
+              postgresql_where=text("status = 'available'")),
+        Index('ix_properties_created_at_id', 'created_at', 'id'),
+        Index('ix_properties_search_tsv', 'search_tsv', postgresql_using='gin'),
+    )
 
 class Lead(Base):
     __tablename__ = "leads"
@@ -103,7 +150,7 @@ class Lead(Base):
     timeline = Column(String)
     
     # Status
-    status = Column(Enum(LeadStatus), default=LeadStatus.NEW)
+    status = Column(EnumString(LeadStatus), default=LeadStatus.NEW)
     assigned_to_id = Column(Integer, ForeignKey("users.id"))
     assigned_to = relationship("User", back_populates="leads")
     
@@ -112,6 +159,24 @@ class Lead(Base):
     next_follow_up = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Full-text search document, maintained by Postgres
+    search_tsv = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') "
+        "|| ' ' || coalesce(email, '') || ' ' || coalesce(address, '') || ' ' || coalesce(city, ''))",
+        persisted=True
+    )))
+    
+    # Fetch updated_at with UPDATE ... RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        enum_check('leads', 'status', LeadStatus),
+        Index('ix_leads_status_new', 'status',
+              postgresql_where=text("status = 'new'")),
+        Index('ix_leads_created_at_id', 'created_at', 'id'),
+        Index('ix_leads_search_tsv', 'search_tsv', postgresql_using='gin'),
+    )
 
 class Deal(Base):
     __tablename__ = "deals"
@@ -122,13 +187,13 @@ class Deal(Base):
     agent_id = Column(Integer, ForeignKey("users.id"))
     
     # Deal details
-    status = Column(Enum(DealStatus), default=DealStatus.PENDING)
+    status = Column(EnumString(DealStatus), default=DealStatus.PENDING)
     offer_price = Column(Float)
     closing_date = Column(DateTime(timezone=True))
     
-    # Financial calculations
-    wholesale_fee = Column(Float)
-    net_profit = Column(Float)
+    # Financial calculations (maintained by the deals_calc_financials trigger)
+    wholesale_fee = Column(Float, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    net_profit = Column(Float, server_default=FetchedValue(), server_onupdate=FetchedValue())
     
     # Notes
     notes = Column(Text)
@@ -138,4 +203,144 @@ class Deal(Base):
     # Relationships
     agent = relationship("User", back_populates="deals")
     property = relationship("Property")
-    lead = relationship("Lead") 
\ No newline at end of file
+    lead = relationship("Lead")
+    
+    # Fetch updated_at and the trigger-set financials with UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        enum_check('deals', 'status', DealStatus),
+        Index('ix_deals_status_pending', 'status',
+              postgresql_where=text("status = 'pending'")),
+        Index('ix_deals_closed_created_at', 'created_at',
+              postgresql_where=text("status = 'closed'")),
+        Index('ix_deals_created_at_id', 'created_at', 'id'),
+    ) 
+
+class StatusCounter(Base):
+    __tablename__ = "status_counters"
+    
+    # Row counts per status, maintained by the status_counters_track trigger
+    entity = Column(String, primary_key=True)  # property, lead or deal
+    status = Column(String, primary_key=True)
+    n = Column(BigInteger, nullable=False, default=0)
+
+# Entity names used in status_counters, keyed to the tables they count
+STATUS_COUNTER_ENTITIES = {
+    "property": Property,
+    "lead": Lead,
+    "deal": Deal,
+}
+
+# Free-text search
+def search_text(*columns):
+    # Immutable concatenation of nullable text columns, usable as an index expression.
+    # Constants are rendered inline so queries match the indexed expression exactly.
+    separator = literal(' ', literal_execute=True)
+    expression = func.coalesce(columns[0], literal_column("''"))
+    for column in columns[1:]:
+        expression = expression.op('||')(separator).op('||')(
+            func.coalesce(column, literal_column("''"))
+        )
+    return expression
+
+leads_table = Lead.__table__
+properties_table = Property.__table__
+
+lead_name_text = search_text(leads_table.c.first_name, leads_table.c.last_name)
+
+# Trigram GIN indexes let the name/address ILIKE '%term%' filters use an index scan
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+Index('ix_leads_name_trgm', lead_name_text.label('name_text'),
+      postgresql_using='gin', postgresql_ops={'name_text': 'gin_trgm_ops'})
+Index('ix_properties_address_trgm', properties_table.c.address,
+      postgresql_using='gin', postgresql_ops={'address': 'gin_trgm_ops'})
+
+# Deal financials: 10% wholesale fee on the property's ARV, net of the spread
+# between offer and purchase price. Kept in the database so every writer agrees.
+DEALS_CALC_FINANCIALS_FUNCTION = """
+CREATE OR REPLACE FUNCTION deals_calc_financials() RETURNS trigger AS $$
+DECLARE
+    property_arv double precision;
+    property_purchase_price double precision;
+BEGIN
+    SELECT arv, purchase_price INTO property_arv, property_purchase_price
+    FROM properties WHERE id = NEW.property_id;
+
+    IF COALESCE(property_arv, 0) <> 0 AND NEW.offer_price IS NOT NULL THEN
+        NEW.wholesale_fee := property_arv * 0.10;
+        NEW.net_profit := NEW.wholesale_fee - (NEW.offer_price - property_purchase_price);
+    ELSE
+        NEW.wholesale_fee := NULL;
+        NEW.net_profit := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+DEALS_CALC_FINANCIALS_TRIGGER = """
+CREATE TRIGGER deals_calc_financials
+BEFORE INSERT OR UPDATE OF offer_price, property_id ON deals
+FOR EACH ROW EXECUTE FUNCTION deals_calc_financials()
+"""
+
+event.listen(
+    Deal.__table__,
+    "after_create",
+    DDL(DEALS_CALC_FINANCIALS_FUNCTION).execute_if(dialect="postgresql")
+)
+event.listen(
+    Deal.__table__,
+    "after_create",
+    DDL(DEALS_CALC_FINANCIALS_TRIGGER).execute_if(dialect="postgresql")
+)
+
+# Status distributions: adjust status_counters on every insert, delete and
+# status change so the dashboard can read them without scanning the tables
+STATUS_COUNTERS_TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION status_counters_track() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status IS NOT NULL THEN
+        UPDATE status_counters SET n = n - 1
+        WHERE entity = TG_ARGV[0] AND status = OLD.status::text;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status IS NOT NULL THEN
+        INSERT INTO status_counters (entity, status, n)
+        VALUES (TG_ARGV[0], NEW.status::text, 1)
+        ON CONFLICT (entity, status) DO UPDATE SET n = status_counters.n + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(STATUS_COUNTERS_TRACK_FUNCTION).execute_if(dialect="postgresql")
+)
+
+for _entity, _model in STATUS_COUNTER_ENTITIES.items():
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(
+            "CREATE TRIGGER %(table)s_status_counts AFTER INSERT OR DELETE ON %(table)s "
+            f"FOR EACH ROW EXECUTE FUNCTION status_counters_track('{_entity}')"
+        ).execute_if(dialect="postgresql")
+    )
+    event.listen(
+        _model.__table__,
+        "after_create",
+        DDL(
+            "CREATE TRIGGER %(table)s_status_counts_update AFTER UPDATE OF status ON %(table)s "
+            "FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) "
+            f"EXECUTE FUNCTION status_counters_track('{_entity}')"
+        ).execute_if(dialect="postgresql")
+    )
\ No newline at end of file
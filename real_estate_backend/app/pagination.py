@@ -0,0 +1,47 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def keyset_page(
+    db: AsyncSession,
+    query: Select,
+    model,
+    response: Response,
+    cursor: Optional[str],
+    skip: int,
+    limit: int
+):
+    """Return one page of the ``query`` select ordered newest first.
+
+    With a cursor the page starts right after the row it encodes, using the
+    (created_at, id) index; without one the legacy ``skip`` offset applies.
+    When the page is full, the cursor for the next page is sent in the
+    X-Next-Cursor response header.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        query = query.where(tuple_(model.created_at, model.id) < decode_cursor(cursor))
+    else:
+        query = query.offset(skip)
+
+    rows = (await db.scalars(query.limit(limit))).all()
+    if rows and len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows
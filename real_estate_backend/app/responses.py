@@ -0,0 +1,29 @@
+from typing import Any, List
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+def list_json_response(adapter: TypeAdapter, rows: List[Any], response: Response) -> Response:
+    """Validate ORM rows and encode them to JSON in one pass through pydantic-core.
+
+    Skips FastAPI's response_model round-trip (Python dicts, then a second JSON
+    encoder) on the large list endpoints. Headers set on the injected ``response``
+    (e.g. the pagination cursor) are carried over. Null fields are left out, as
+    with ``response_model_exclude_none`` on the routes.
+    """
+    body = adapter.dump_json(
+        adapter.validate_python(rows, from_attributes=True), exclude_none=True
+    )
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
+
+class CompactRoute(APIRoute):
+    """Route that leaves unset and null fields out of its response_model output.
+
+    FastAPI has no router-level default for these flags, so routers opt in with
+    ``APIRouter(route_class=CompactRoute)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs["response_model_exclude_unset"] = True
+        kwargs["response_model_exclude_none"] = True
+        super().__init__(*args, **kwargs)
@@ -1,21 +1,23 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_db
 from ..models import User
 from ..schemas import UserCreate, User as UserSchema, Token
 from ..auth import authenticate_user, create_access_token, get_password_hash, get_current_active_user
 from ..config import settings
+from ..responses import CompactRoute
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(prefix="/auth", tags=["authentication"], route_class=CompactRoute)
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,29 +31,29 @@ async def login_for_access_token(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/register", response_model=UserSchema)
-async def register_user(user: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = (await db.scalars(select(User).where(User.email == user.email))).first()
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    db_user = db.query(User).filter(User.username == user.username).first()
+    db_user = (await db.scalars(select(User).where(User.username == user.username))).first()
     if db_user:
         raise HTTPException(status_code=400, detail="Username already taken")
     
     # Create new user
     hashed_password = get_password_hash(user.password)
-    db_user = User(
-        email=user.email,
-        username=user.username,
-        full_name=user.full_name,
-        role=user.role,
-        phone=user.phone,
-        hashed_password=hashed_password
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db_user = (await db.scalars(
+        insert(User).values(
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            phone=user.phone,
+            hashed_password=hashed_password
+        ).returning(User)
+    )).one()
+    await db.commit()
     return db_user
 
 @router.get("/me", response_model=UserSchema)
@@ -1,48 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, delete, func, insert, literal, literal_column, select, text
 from ..database import get_db
-from ..models import Property, Lead, Deal, PropertyStatus, LeadStatus, DealStatus, User
-from ..schemas import DashboardStats
+from ..models import (
+    Property, Lead, Deal, PropertyStatus, LeadStatus, DealStatus, User, UserRole,
+    StatusCounter, STATUS_COUNTER_ENTITIES
+)
+from ..schemas import DashboardStats, RecentActivity
 from ..auth import get_current_active_user
+from ..cache import cache_config, invalidate_dashboard
+from ..responses import CompactRoute
 
-router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+router = APIRouter(prefix="/dashboard", tags=["dashboard"], route_class=CompactRoute)
+
+async def _status_distribution(db: AsyncSession, entity: str):
+    # Read the trigger-maintained counters instead of a GROUP BY over the table
+    counters = (await db.execute(
+        select(StatusCounter.status, StatusCounter.n).where(
+            StatusCounter.entity == entity,
+            StatusCounter.n > 0
+        )
+    )).all()
+    return dict(counters)
 
 @router.get("/stats", response_model=DashboardStats)
+@cache_config(ttl_seconds=300)
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Property stats
-    total_properties = db.query(func.count(Property.id)).scalar()
-    available_properties = db.query(func.count(Property.id)).filter(
-        Property.status == PropertyStatus.AVAILABLE
-    ).scalar()
+    total_properties, available_properties = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Property.status == PropertyStatus.AVAILABLE)
+        ).select_from(Property)
+    )).one()
     
     # Lead stats
-    total_leads = db.query(func.count(Lead.id)).scalar()
-    new_leads = db.query(func.count(Lead.id)).filter(
-        Lead.status == LeadStatus.NEW
-    ).scalar()
-    
-    # Deal stats
-    total_deals = db.query(func.count(Deal.id)).scalar()
-    pending_deals = db.query(func.count(Deal.id)).filter(
-        Deal.status == DealStatus.PENDING
-    ).scalar()
-    
-    # Revenue stats
-    total_revenue = db.query(func.sum(Deal.net_profit)).filter(
-        Deal.status == DealStatus.CLOSED
-    ).scalar() or 0
+    total_leads, new_leads = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Lead.status == LeadStatus.NEW)
+        ).select_from(Lead)
+    )).one()
     
-    # Monthly revenue (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    monthly_revenue = db.query(func.sum(Deal.net_profit)).filter(
-        Deal.status == DealStatus.CLOSED,
-        Deal.created_at >= thirty_days_ago
-    ).scalar() or 0
+    # Deal and revenue stats (monthly revenue covers the last 30 days)
+    total_deals, pending_deals, total_revenue, monthly_revenue = (await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Deal.status == DealStatus.PENDING),
+            func.sum(Deal.net_profit).filter(Deal.status == DealStatus.CLOSED),
+            func.sum(Deal.net_profit).filter(
+                Deal.status == DealStatus.CLOSED,
+                Deal.created_at >= func.now() - text("interval '30 days'")
+            )
+        ).select_from(Deal)
+    )).one()
     
     return DashboardStats(
         total_properties=total_properties,
@@ -51,93 +66,131 @@ async def get_dashboard_stats(
         new_leads=new_leads,
         total_deals=total_deals,
         pending_deals=pending_deals,
-        total_revenue=float(total_revenue),
-        monthly_revenue=float(monthly_revenue)
+        total_revenue=float(total_revenue or 0),
+        monthly_revenue=float(monthly_revenue or 0)
     )
 
-@router.get("/recent-activity")
+@router.get("/recent-activity", response_model=RecentActivity)
+@cache_config(ttl_seconds=300)
 async def get_recent_activity(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    # Recent properties
-    recent_properties = db.query(Property).order_by(
-        Property.created_at.desc()
-    ).limit(5).all()
+    # Recent properties (only the columns the activity feed shows)
+    recent_properties = (await db.execute(
+        select(Property.id, Property.address, Property.city, Property.status, Property.created_at)
+        .order_by(Property.created_at.desc()).limit(5)
+    )).all()
     
     # Recent leads
-    recent_leads = db.query(Lead).order_by(
-        Lead.created_at.desc()
-    ).limit(5).all()
+    recent_leads = (await db.execute(
+        select(Lead.id, Lead.first_name, Lead.last_name, Lead.status, Lead.created_at)
+        .order_by(Lead.created_at.desc()).limit(5)
+    )).all()
     
     # Recent deals
-    recent_deals = db.query(Deal).order_by(
-        Deal.created_at.desc()
-    ).limit(5).all()
+    recent_deals = (await db.execute(
+        select(
+            Deal.id, Deal.property_id, Deal.lead_id, Deal.status,
+            Deal.offer_price, Deal.net_profit, Deal.created_at
+        ).order_by(Deal.created_at.desc()).limit(5)
+    )).all()
     
-    return {
+    return RecentActivity.model_validate({
         "recent_properties": recent_properties,
         "recent_leads": recent_leads,
         "recent_deals": recent_deals
-    }
+    }, from_attributes=True)
 
 @router.get("/property-status-distribution")
+@cache_config(ttl_seconds=300)
 async def get_property_status_distribution(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    status_counts = db.query(
-        Property.status,
-        func.count(Property.id)
-    ).group_by(Property.status).all()
-    
-    return dict(status_counts)
+    return await _status_distribution(db, "property")
 
 @router.get("/lead-status-distribution")
+@cache_config(ttl_seconds=300)
 async def get_lead_status_distribution(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    status_counts = db.query(
-        Lead.status,
-        func.count(Lead.id)
-    ).group_by(Lead.status).all()
-    
-    return dict(status_counts)
+    return await _status_distribution(db, "lead")
 
 @router.get("/deal-status-distribution")
+@cache_config(ttl_seconds=300)
 async def get_deal_status_distribution(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    status_counts = db.query(
-        Deal.status,
-        func.count(Deal.id)
-    ).group_by(Deal.status).all()
+    return await _status_distribution(db, "deal")
+
+@router.post("/status-counters/rebuild")
+async def rebuild_status_counters(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    return dict(status_counts)
+    # Block writers while the counters are recomputed from the tables
+    await db.execute(text("LOCK TABLE properties, leads, deals IN SHARE MODE"))
+    await db.execute(delete(StatusCounter))
+    for entity, model in STATUS_COUNTER_ENTITIES.items():
+        await db.execute(
+            insert(StatusCounter).from_select(
+                ["entity", "status", "n"],
+                select(literal(entity), model.status, func.count())
+                .where(model.status.is_not(None))
+                .group_by(model.status)
+            )
+        )
+    await db.commit()
+    await invalidate_dashboard()
+    return {"message": "Status counters rebuilt"}
 
 @router.get("/monthly-revenue")
+@cache_config(ttl_seconds=300)
 async def get_monthly_revenue(
+    request: Request,
     months: int = 6,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    # Get revenue for the last N months
-    monthly_data = []
-    for i in range(months):
-        start_date = datetime.utcnow() - timedelta(days=30 * (i + 1))
-        end_date = datetime.utcnow() - timedelta(days=30 * i)
-        
-        revenue = db.query(func.sum(Deal.net_profit)).filter(
+    if months <= 0:
+        return []
+    
+    # Start of each of the last N calendar months, oldest first, taken from the
+    # database clock so the buckets line up with the deals' created_at values
+    current_month = func.date_trunc(literal_column("'month'"), func.now())
+    first_month = current_month - func.make_interval(0, months - 1)
+    month_series = func.generate_series(
+        first_month,
+        current_month,
+        text("interval '1 month'")
+    ).table_valued("month").render_derived(name="month_starts")
+    
+    # Revenue for all months in a single grouped query; months without closed
+    # deals are reported with zero revenue. The label is formatted in SQL, in
+    # the same session time zone as the buckets (the driver returns UTC)
+    revenue_rows = (await db.execute(
+        select(func.to_char(month_series.c.month, "YYYY-MM"), func.sum(Deal.net_profit))
+        .select_from(month_series)
+        .outerjoin(Deal, and_(
             Deal.status == DealStatus.CLOSED,
-            Deal.created_at >= start_date,
-            Deal.created_at < end_date
-        ).scalar() or 0
-        
-        monthly_data.append({
-            "month": start_date.strftime("%Y-%m"),
-            "revenue": float(revenue)
-        })
+            Deal.created_at >= first_month,
+            func.date_trunc(literal_column("'month'"), Deal.created_at) == month_series.c.month
+        ))
+        .group_by(month_series.c.month)
+        .order_by(month_series.c.month)
+    )).all()
     
-    return monthly_data[::-1]  # Reverse to show oldest first 
\ No newline at end of file
+    return [
+        {"month": month, "revenue": float(revenue or 0)}
+        for month, revenue in revenue_rows
+    ]
@@ -1,76 +1,74 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, text, update
 from ..database import get_db
-from ..models import Deal, DealStatus, Property, Lead, User
-from ..schemas import DealCreate, DealUpdate, Deal as DealSchema
+from ..models import Deal, DealStatus, Property, PropertyStatus, Lead, User, UserRole
+from ..schemas import DealCreate, DealUpdate, Deal as DealSchema, DealList
 from ..auth import get_current_active_user
+from ..cache import invalidate_dashboard
+from ..pagination import keyset_page
+from ..responses import CompactRoute, list_json_response
 
-router = APIRouter(prefix="/deals", tags=["deals"])
+router = APIRouter(prefix="/deals", tags=["deals"], route_class=CompactRoute)
 
 @router.post("/", response_model=DealSchema)
 async def create_deal(
     deal: DealCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Verify property and lead exist
-    property = db.query(Property).filter(Property.id == deal.property_id).first()
+    property = await db.get(Property, deal.property_id)
     if not property:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    lead = db.query(Lead).filter(Lead.id == deal.lead_id).first()
+    lead = await db.get(Lead, deal.lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    # Calculate wholesale fee and net profit
-    if property.arv and deal.offer_price:
-        wholesale_fee = property.arv * 0.10  # 10% wholesale fee
-        net_profit = wholesale_fee - (deal.offer_price - property.purchase_price)
-    else:
-        wholesale_fee = None
-        net_profit = None
-    
-    db_deal = Deal(
-        **deal.dict(),
-        agent_id=current_user.id,
-        wholesale_fee=wholesale_fee,
-        net_profit=net_profit
-    )
-    db.add(db_deal)
-    db.commit()
-    db.refresh(db_deal)
-    return db_deal
+    # wholesale_fee and net_profit are filled in by the deals_calc_financials trigger
+    # and come back with the rest of the row through INSERT ... RETURNING
+    db_deal = (await db.scalars(
+        insert(Deal).values(
+            **deal.dict(exclude={"agent_id"}),
+            agent_id=current_user.id
+        ).returning(Deal)
+    )).one()
+    created = DealSchema.model_validate(db_deal)
+    await db.commit()
+    await invalidate_dashboard()
+    return created
 
 @router.get("/", response_model=List[DealSchema])
 async def get_deals(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     status: Optional[DealStatus] = None,
     agent_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Deal)
+    query = select(Deal)
     
     if status:
-        query = query.filter(Deal.status == status)
+        query = query.where(Deal.status == status)
     
     if agent_id:
-        query = query.filter(Deal.agent_id == agent_id)
+        query = query.where(Deal.agent_id == agent_id)
     
-    deals = query.offset(skip).limit(limit).all()
-    return deals
+    deals = await keyset_page(db, query, Deal, response, cursor, skip, limit)
+    return list_json_response(DealList, deals, response)
 
 @router.get("/{deal_id}", response_model=DealSchema)
 async def get_deal(
     deal_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    deal = db.query(Deal).filter(Deal.id == deal_id).first()
+    deal = await db.get(Deal, deal_id)
     if deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
     return deal
@@ -79,87 +77,107 @@ async def get_deal(
 async def update_deal(
     deal_id: int,
     deal_update: DealUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_deal = db.query(Deal).filter(Deal.id == deal_id).first()
+    # UPDATE ... RETURNING changes and reads back the row in one round-trip;
+    # financials are recalculated by the deals_calc_financials trigger
+    update_data = deal_update.dict(exclude_unset=True)
+    db_deal = (await db.scalars(
+        update(Deal).where(Deal.id == deal_id).values(**update_data).returning(Deal)
+    )).one_or_none()
     if db_deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
     
-    update_data = deal_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_deal, field, value)
-    
-    # Recalculate financials if offer price changed
-    if 'offer_price' in update_data and db_deal.property.arv:
-        db_deal.wholesale_fee = db_deal.property.arv * 0.10
-        db_deal.net_profit = db_deal.wholesale_fee - (db_deal.offer_price - db_deal.property.purchase_price)
-    
-    db.commit()
-    db.refresh(db_deal)
-    return db_deal
+    updated = DealSchema.model_validate(db_deal)
+    await db.commit()
+    await invalidate_dashboard()
+    return updated
 
 @router.delete("/{deal_id}")
 async def delete_deal(
     deal_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_deal = db.query(Deal).filter(Deal.id == deal_id).first()
-    if db_deal is None:
+    result = await db.execute(delete(Deal).where(Deal.id == deal_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Deal not found")
     
-    db.delete(db_deal)
-    db.commit()
+    await db.commit()
+    await invalidate_dashboard()
     return {"message": "Deal deleted successfully"}
 
 @router.put("/{deal_id}/status")
 async def update_deal_status(
     deal_id: int,
     status: DealStatus,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_deal = db.query(Deal).filter(Deal.id == deal_id).first()
-    if db_deal is None:
+    updated = (await db.execute(
+        update(Deal).where(Deal.id == deal_id).values(status=status).returning(Deal.property_id)
+    )).first()
+    if updated is None:
         raise HTTPException(status_code=404, detail="Deal not found")
     
-    db_deal.status = status
-    
     # Update property status if deal is closed
-    if status == DealStatus.CLOSED:
-        db_deal.property.status = "sold"
-        db_deal.property.sold_date = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_deal)
+    property_id = updated.property_id
+    if status == DealStatus.CLOSED and property_id is not None:
+        await db.execute(
+            update(Property).where(Property.id == property_id).values(
+                status=PropertyStatus.SOLD,
+                sold_date=func.now()
+            )
+        )
+    
+    await db.commit()
+    await invalidate_dashboard()
     return {"message": f"Deal status updated to {status}"}
 
+@router.post("/recalculate")
+async def recalculate_deals(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    # Touching offer_price fires deals_calc_financials for every row, picking up
+    # ARV and purchase price changes made to properties since the deal was saved;
+    # updated_at is set to itself so the onupdate default leaves it alone
+    result = await db.execute(
+        update(Deal).values(offer_price=Deal.offer_price, updated_at=Deal.updated_at)
+    )
+    await db.commit()
+    await invalidate_dashboard()
+    return {"message": "Deal financials recalculated", "updated": result.rowcount}
+
 @router.get("/analytics/summary")
 async def get_deals_analytics(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Total deals
-    total_deals = db.query(func.count(Deal.id)).scalar()
+    total_deals = await db.scalar(select(func.count()).select_from(Deal))
     
     # Deals by status
-    deals_by_status = db.query(
-        Deal.status,
-        func.count(Deal.id)
-    ).group_by(Deal.status).all()
+    deals_by_status = (await db.execute(
+        select(Deal.status, func.count()).group_by(Deal.status)
+    )).all()
     
     # Total revenue
-    total_revenue = db.query(func.sum(Deal.net_profit)).filter(
-        Deal.status == DealStatus.CLOSED
-    ).scalar() or 0
+    total_revenue = await db.scalar(
+        select(func.sum(Deal.net_profit)).where(Deal.status == DealStatus.CLOSED)
+    ) or 0
     
     # Monthly revenue (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    monthly_revenue = db.query(func.sum(Deal.net_profit)).filter(
-        Deal.status == DealStatus.CLOSED,
-        Deal.created_at >= thirty_days_ago
-    ).scalar() or 0
+    monthly_revenue = await db.scalar(
+        select(func.sum(Deal.net_profit)).where(
+            Deal.status == DealStatus.CLOSED,
+            Deal.created_at >= func.now() - text("interval '30 days'")
+        )
+    ) or 0
     
     return {
         "total_deals": total_deals,
@@ -1,67 +1,67 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, update
 from ..database import get_db
-from ..models import Lead, LeadStatus, User
-from ..schemas import LeadCreate, LeadUpdate, Lead as LeadSchema, LeadSearch
+from ..models import Lead, LeadStatus, User, lead_name_text
+from ..schemas import LeadCreate, LeadUpdate, Lead as LeadSchema, LeadSearch, LeadList
 from ..auth import get_current_active_user
+from ..cache import invalidate_dashboard
+from ..pagination import keyset_page
+from ..responses import CompactRoute, list_json_response
 
-router = APIRouter(prefix="/leads", tags=["leads"])
+router = APIRouter(prefix="/leads", tags=["leads"], route_class=CompactRoute)
 
 @router.post("/", response_model=LeadSchema)
 async def create_lead(
     lead: LeadCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_lead = Lead(**lead.dict())
-    if not db_lead.assigned_to_id:
-        db_lead.assigned_to_id = current_user.id
-    db.add(db_lead)
-    db.commit()
-    db.refresh(db_lead)
-    return db_lead
+    lead_data = lead.dict()
+    if not lead_data["assigned_to_id"]:
+        lead_data["assigned_to_id"] = current_user.id
+    
+    # INSERT ... RETURNING fills id and server defaults without a follow-up SELECT
+    db_lead = (await db.scalars(insert(Lead).values(**lead_data).returning(Lead))).one()
+    created = LeadSchema.model_validate(db_lead)
+    await db.commit()
+    await invalidate_dashboard()
+    return created
 
 @router.get("/", response_model=List[LeadSchema])
 async def get_leads(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     status: Optional[LeadStatus] = None,
     assigned_to_id: Optional[int] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Lead)
+    query = select(Lead)
     
     if status:
-        query = query.filter(Lead.status == status)
+        query = query.where(Lead.status == status)
     
     if assigned_to_id:
-        query = query.filter(Lead.assigned_to_id == assigned_to_id)
+        query = query.where(Lead.assigned_to_id == assigned_to_id)
     
     if search:
-        query = query.filter(
-            or_(
-                Lead.first_name.contains(search),
-                Lead.last_name.contains(search),
-                Lead.email.contains(search),
-                Lead.address.contains(search),
-                Lead.city.contains(search)
-            )
-        )
+        query = query.where(Lead.search_tsv.op('@@')(func.plainto_tsquery('simple', search)))
     
-    leads = query.offset(skip).limit(limit).all()
-    return leads
+    leads = await keyset_page(db, query, Lead, response, cursor, skip, limit)
+    return list_json_response(LeadList, leads, response)
 
 @router.get("/{lead_id}", response_model=LeadSchema)
 async def get_lead(
     lead_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    lead = await db.get(Lead, lead_id)
     if lead is None:
         raise HTTPException(status_code=404, detail="Lead not found")
     return lead
@@ -70,75 +70,71 @@ async def get_lead(
 async def update_lead(
     lead_id: int,
     lead_update: LeadUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    # UPDATE ... RETURNING changes and reads back the row in one round-trip
+    update_data = lead_update.dict(exclude_unset=True)
+    db_lead = (await db.scalars(
+        update(Lead).where(Lead.id == lead_id).values(**update_data).returning(Lead)
+    )).one_or_none()
     if db_lead is None:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    update_data = lead_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_lead, field, value)
-    
-    db.commit()
-    db.refresh(db_lead)
-    return db_lead
+    updated = LeadSchema.model_validate(db_lead)
+    await db.commit()
+    await invalidate_dashboard()
+    return updated
 
 @router.delete("/{lead_id}")
 async def delete_lead(
     lead_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if db_lead is None:
+    result = await db.execute(delete(Lead).where(Lead.id == lead_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    db.delete(db_lead)
-    db.commit()
+    await db.commit()
+    await invalidate_dashboard()
     return {"message": "Lead deleted successfully"}
 
 @router.get("/search/", response_model=List[LeadSchema])
 async def search_leads(
     search_params: LeadSearch = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Lead)
+    query = select(Lead)
     
     if search_params.name:
-        query = query.filter(
-            or_(
-                Lead.first_name.contains(search_params.name),
-                Lead.last_name.contains(search_params.name)
-            )
-        )
+        query = query.where(lead_name_text.ilike(f"%{search_params.name}%"))
     
     if search_params.city:
-        query = query.filter(Lead.city == search_params.city)
+        query = query.where(Lead.city == search_params.city)
     
     if search_params.status:
-        query = query.filter(Lead.status == search_params.status)
+        query = query.where(Lead.status == search_params.status)
     
     if search_params.assigned_to_id:
-        query = query.filter(Lead.assigned_to_id == search_params.assigned_to_id)
+        query = query.where(Lead.assigned_to_id == search_params.assigned_to_id)
     
-    leads = query.all()
+    leads = (await db.scalars(query)).all()
     return leads
 
 @router.put("/{lead_id}/status")
 async def update_lead_status(
     lead_id: int,
     status: LeadStatus,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    db_lead = await db.get(Lead, lead_id)
     if db_lead is None:
         raise HTTPException(status_code=404, detail="Lead not found")
     
     db_lead.status = status
-    db.commit()
-    db.refresh(db_lead)
+    await db.commit()
+    await invalidate_dashboard()
     return {"message": f"Lead status updated to {status}"} 
\ No newline at end of file
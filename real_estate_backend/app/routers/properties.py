@@ -1,67 +1,69 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, update
 from ..database import get_db
 from ..models import Property, PropertyStatus, User
-from ..schemas import PropertyCreate, PropertyUpdate, Property as PropertySchema, PropertySearch
+from ..schemas import PropertyCreate, PropertyUpdate, Property as PropertySchema, PropertySearch, PropertyList
 from ..auth import get_current_active_user
+from ..cache import invalidate_dashboard
+from ..pagination import keyset_page
+from ..responses import CompactRoute, list_json_response
 
-router = APIRouter(prefix="/properties", tags=["properties"])
+router = APIRouter(prefix="/properties", tags=["properties"], route_class=CompactRoute)
 
 @router.post("/", response_model=PropertySchema)
 async def create_property(
     property: PropertyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_property = Property(**property.dict())
-    db.add(db_property)
-    db.commit()
-    db.refresh(db_property)
-    return db_property
+    # INSERT ... RETURNING fills id and server defaults without a follow-up SELECT
+    db_property = (await db.scalars(
+        insert(Property).values(**property.dict()).returning(Property)
+    )).one()
+    created = PropertySchema.model_validate(db_property)
+    await db.commit()
+    await invalidate_dashboard()
+    return created
 
 @router.get("/", response_model=List[PropertySchema])
 async def get_properties(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     status: Optional[PropertyStatus] = None,
     city: Optional[str] = None,
     state: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Property)
+    query = select(Property)
     
     if search:
-        query = query.filter(
-            or_(
-                Property.address.contains(search),
-                Property.city.contains(search),
-                Property.state.contains(search)
-            )
-        )
+        query = query.where(Property.search_tsv.op('@@')(func.plainto_tsquery('simple', search)))
     
     if status:
-        query = query.filter(Property.status == status)
+        query = query.where(Property.status == status)
     
     if city:
-        query = query.filter(Property.city == city)
+        query = query.where(Property.city == city)
     
     if state:
-        query = query.filter(Property.state == state)
+        query = query.where(Property.state == state)
     
-    properties = query.offset(skip).limit(limit).all()
-    return properties
+    properties = await keyset_page(db, query, Property, response, cursor, skip, limit)
+    return list_json_response(PropertyList, properties, response)
 
 @router.get("/{property_id}", response_model=PropertySchema)
 async def get_property(
     property_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    property = db.query(Property).filter(Property.id == property_id).first()
+    property = await db.get(Property, property_id)
     if property is None:
         raise HTTPException(status_code=404, detail="Property not found")
     return property
@@ -70,63 +72,64 @@ async def get_property(
 async def update_property(
     property_id: int,
     property_update: PropertyUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_property = db.query(Property).filter(Property.id == property_id).first()
+    # UPDATE ... RETURNING changes and reads back the row in one round-trip
+    update_data = property_update.dict(exclude_unset=True)
+    db_property = (await db.scalars(
+        update(Property).where(Property.id == property_id).values(**update_data).returning(Property)
+    )).one_or_none()
     if db_property is None:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    update_data = property_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_property, field, value)
-    
-    db.commit()
-    db.refresh(db_property)
-    return db_property
+    updated = PropertySchema.model_validate(db_property)
+    await db.commit()
+    await invalidate_dashboard()
+    return updated
 
 @router.delete("/{property_id}")
 async def delete_property(
     property_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    db_property = db.query(Property).filter(Property.id == property_id).first()
-    if db_property is None:
+    result = await db.execute(delete(Property).where(Property.id == property_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Property not found")
     
-    db.delete(db_property)
-    db.commit()
+    await db.commit()
+    await invalidate_dashboard()
     return {"message": "Property deleted successfully"}
 
 @router.get("/search/", response_model=List[PropertySchema])
 async def search_properties(
     search_params: PropertySearch = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    query = db.query(Property)
+    query = select(Property)
     
     if search_params.address:
-        query = query.filter(Property.address.contains(search_params.address))
+        query = query.where(Property.address.ilike(f"%{search_params.address}%"))
     
     if search_params.city:
-        query = query.filter(Property.city == search_params.city)
+        query = query.where(Property.city == search_params.city)
     
     if search_params.state:
-        query = query.filter(Property.state == search_params.state)
+        query = query.where(Property.state == search_params.state)
     
     if search_params.property_type:
-        query = query.filter(Property.property_type == search_params.property_type)
+        query = query.where(Property.property_type == search_params.property_type)
     
     if search_params.status:
-        query = query.filter(Property.status == search_params.status)
+        query = query.where(Property.status == search_params.status)
     
     if search_params.min_price:
-        query = query.filter(Property.purchase_price >= search_params.min_price)
+        query = query.where(Property.purchase_price >= search_params.min_price)
     
     if search_params.max_price:
-        query = query.filter(Property.purchase_price <= search_params.max_price)
+        query = query.where(Property.purchase_price <= search_params.max_price)
     
-    properties = query.all()
+    properties = (await db.scalars(query)).all()
     return properties 
\ No newline at end of file
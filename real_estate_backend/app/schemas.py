@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from .models import UserRole, PropertyStatus, LeadStatus, DealStatus
@@ -138,8 +138,6 @@ class DealBase(BaseModel):
     lead_id: int
     offer_price: float
     closing_date: Optional[datetime] = None
-    wholesale_fee: Optional[float] = None
-    net_profit: Optional[float] = None
     notes: Optional[str] = None
 
 class DealCreate(DealBase):
@@ -149,14 +147,14 @@ class DealUpdate(BaseModel):
     offer_price: Optional[float] = None
     status: Optional[DealStatus] = None
     closing_date: Optional[datetime] = None
-    wholesale_fee: Optional[float] = None
-    net_profit: Optional[float] = None
     notes: Optional[str] = None
 
 class Deal(DealBase):
     id: int
     agent_id: int
     status: DealStatus
+    wholesale_fee: Optional[float] = None
+    net_profit: Optional[float] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
@@ -182,6 +180,43 @@ class DashboardStats(BaseModel):
     total_revenue: float
     monthly_revenue: float
 
+class RecentProperty(BaseModel):
+    id: int
+    address: str
+    city: Optional[str] = None
+    status: PropertyStatus
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class RecentLead(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    status: LeadStatus
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class RecentDeal(BaseModel):
+    id: int
+    property_id: int
+    lead_id: int
+    status: DealStatus
+    offer_price: Optional[float] = None
+    net_profit: Optional[float] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class RecentActivity(BaseModel):
+    recent_properties: List[RecentProperty]
+    recent_leads: List[RecentLead]
+    recent_deals: List[RecentDeal]
+
 # Search and filter schemas
 class PropertySearch(BaseModel):
     address: Optional[str] = None
@@ -196,4 +231,9 @@ class LeadSearch(BaseModel):
     name: Optional[str] = None
     city: Optional[str] = None
     status: Optional[LeadStatus] = None
-    assigned_to_id: Optional[int] = None 
\ No newline at end of file
+    assigned_to_id: Optional[int] = None 
+
+# Adapters for encoding list responses directly to JSON
+PropertyList = TypeAdapter(List[Property])
+LeadList = TypeAdapter(List[Lead])
+DealList = TypeAdapter(List[Deal])
\ No newline at end of file
@@ -1,64 +1,111 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
-from sqlalchemy import create_engine
-from app.database import engine
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import orjson
+from sqlalchemy.orm import configure_mappers
+from app.database import engine, keep_pool_alive, warm_pool
 from app.models import Base
 from app.routers import auth, properties, leads, deals, dashboard
 from app.config import settings
+from app.cache import init_cache, close_cache
+from app.pagination import NEXT_CURSOR_HEADER
+from app.middleware import OriginCORSMiddleware, StaticETagMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    Base.metadata.create_all(bind=engine)
+    # Startup (other environments are migrated with `alembic upgrade head`;
+    # several workers would race each other's CREATE TABLE)
+    if settings.ENV == "dev" and settings.WORKERS == 1:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    if settings.WARM_POOL:
+        await warm_pool()
+    await init_cache()
+    # Pay the one-off mapper configuration and OpenAPI build here rather than
+    # on the first request (the pydantic schemas are already built at import)
+    configure_mappers()
+    if DOCS_ENABLED:
+        app.openapi()
+    keepalive = asyncio.create_task(keep_pool_alive())
     yield
     # Shutdown
-    pass
+    keepalive.cancel()
+    with suppress(asyncio.CancelledError):
+        await keepalive
+    await close_cache()
+    await engine.dispose()
+
+# API docs (and the OpenAPI schema behind them) are not served in production
+DOCS_ENABLED = settings.ENV != "prod"
 
 app = FastAPI(
     title=settings.APP_NAME,
     description="Real Estate Wholesale Business Management System",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    debug=False,
+    docs_url="/docs" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
     lifespan=lifespan
 )
 
-# CORS middleware
+# Conditional GETs for responses that never change while the process runs
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:5173"],  # React dev servers
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    StaticETagMiddleware,
+    paths=[path for path in ("/", "/health", app.openapi_url) if path]
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api/v1")
-app.include_router(properties.router, prefix="/api/v1")
-app.include_router(leads.router, prefix="/api/v1")
-app.include_router(deals.router, prefix="/api/v1")
-app.include_router(dashboard.router, prefix="/api/v1")
+# Browser-facing middleware; the test environment talks to the app directly
+if settings.ENV != "test":
+    # CORS middleware
+    app.add_middleware(
+        OriginCORSMiddleware,
+        allow_origins=sorted(settings.CORS_ORIGINS),
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["authorization", "content-type", "x-requested-with"],
+        expose_headers=[NEXT_CURSOR_HEADER],
+    )
+    
+    # Compress list payloads; small responses are not worth the CPU, and level 5
+    # keeps most of the size reduction of the default level 9 at a fraction of the cost
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Include routers under a single /api/v1 parent
+api_v1 = APIRouter(prefix="/api/v1")
+for router in (auth.router, properties.router, leads.router, deals.router, dashboard.router):
+    api_v1.include_router(router)
+app.include_router(api_v1)
+
+# Static bodies, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Real Estate Wholesale Business API",
+    "version": "1.0.0",
+    **({"docs": "/docs", "redoc": "/redoc"} if DOCS_ENABLED else {})
+})
+_HEALTH_BODY = b'{"status":"healthy"}'
 
 @app.get("/")
 async def root():
-    return {
-        "message": "Real Estate Wholesale Business API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": "2025-07-12T00:46:31Z"}
-
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request, exc):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"detail": exc.detail}
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Import string so uvicorn can start several worker processes
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.WORKERS,
+        access_log=False,
+        log_level="warning"
+    ) 
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Production entrypoint: WORKERS uvicorn processes sharing port 8000 via SO_REUSEPORT.
+
+Each process binds its own listening socket, so the kernel spreads incoming
+connections across them instead of every worker contending for one accept
+queue. Requires Linux (or another OS with SO_REUSEPORT).
+"""
+import multiprocessing
+import signal
+import socket
+import uvicorn
+from app.config import settings
+
+HOST = "0.0.0.0"
+PORT = 8000
+
+def _bind() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((HOST, PORT))
+    return sock
+
+def _serve():
+    config = uvicorn.Config(
+        "main:app",
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning"
+    )
+    uvicorn.Server(config).run(sockets=[_bind()])
+
+if __name__ == "__main__":
+    workers = [multiprocessing.Process(target=_serve) for _ in range(settings.WORKERS)]
+    for worker in workers:
+        worker.start()
+
+    # Installed after the fork so workers keep uvicorn's own handlers;
+    # the parent only relays the stop request and waits
+    def _stop(signum, frame):
+        for worker in workers:
+            worker.terminate()
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+    for worker in workers:
+        worker.join()
@@ -0,0 +1,143 @@
+import unittest
+import os
+import sys
+import asyncio
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'real_estate_backend')))  # Add backend root to Python path
+import redis.asyncio as redis
+from pydantic import BaseModel
+from app import cache
+
+class StubSession:
+    """Stands in for the AsyncSession; counts the queries the route runs."""
+
+    def __init__(self):
+        self.queries = 0
+
+    async def scalar(self):
+        self.queries += 1
+        return self.queries
+
+class InMemoryRedis:
+    """The subset of the redis client that the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+class FailingRedis:
+    async def get(self, key):
+        raise redis.ConnectionError("down")
+
+    async def set(self, key, value, ex=None):
+        raise redis.ConnectionError("down")
+
+    async def incr(self, key):
+        raise redis.ConnectionError("down")
+
+class Stats(BaseModel):
+    total: int
+    note: Optional[str] = None
+
+@cache.cache_config(ttl_seconds=300)
+async def count_route(request, db, current_user):
+    return {"count": await db.scalar()}
+
+@cache.cache_config(ttl_seconds=300)
+async def model_route(request, db, current_user):
+    return Stats(total=await db.scalar())
+
+def make_request(path="/api/v1/dashboard/stats", query=""):
+    return SimpleNamespace(url=SimpleNamespace(path=path, query=query))
+
+class TestCacheConfig(unittest.TestCase):
+    def setUp(self):
+        cache._local.clear()
+        cache._redis = None
+        self.db = StubSession()
+
+    def tearDown(self):
+        cache._local.clear()
+        cache._redis = None
+
+    def call(self, route=count_route, user_id=1, **request):
+        response = asyncio.run(route(
+            request=make_request(**request),
+            db=self.db,
+            current_user=SimpleNamespace(id=user_id),
+        ))
+        return response.body
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.call(), b'{"count":1}')
+        self.assertEqual(self.call(), b'{"count":1}')
+        self.assertEqual(self.db.queries, 1)
+
+    def test_entries_are_shared_between_users(self):
+        self.call(user_id=1)
+        self.call(user_id=2)
+        self.assertEqual(self.db.queries, 1)
+
+    def test_query_string_is_part_of_key(self):
+        self.call(query="months=3")
+        self.assertEqual(self.call(query="months=6"), b'{"count":2}')
+
+    def test_invalidate_forces_recompute(self):
+        self.call()
+        asyncio.run(cache.invalidate_dashboard())
+        self.assertEqual(self.call(), b'{"count":2}')
+
+    def test_local_entry_expires(self):
+        with patch.object(cache.time, "monotonic", return_value=1000.0):
+            self.call()
+        with patch.object(cache.time, "monotonic", return_value=1000.0 + cache.LOCAL_TTL_SECONDS - 1):
+            self.assertEqual(self.call(), b'{"count":1}')
+        with patch.object(cache.time, "monotonic", return_value=1000.0 + cache.LOCAL_TTL_SECONDS + 1):
+            self.assertEqual(self.call(), b'{"count":2}')
+
+    def test_local_cache_is_bounded(self):
+        with patch.object(cache, "LOCAL_MAX_ENTRIES", 2):
+            for months in range(3):
+                self.call(query=f"months={months}")
+            self.assertEqual(len(cache._local), 2)
+            self.assertEqual(self.call(query="months=0"), b'{"count":4}')
+
+    def test_model_results_omit_none(self):
+        self.assertEqual(self.call(route=model_route), b'{"total":1}')
+
+    def test_redis_shared_between_workers(self):
+        cache._redis = InMemoryRedis()
+        self.call()
+        cache._local.clear()  # another worker only sees Redis
+        self.assertEqual(self.call(), b'{"count":1}')
+        self.assertEqual(self.db.queries, 1)
+
+    def test_invalidate_bumps_version_for_other_workers(self):
+        cache._redis = InMemoryRedis()
+        self.call()
+        asyncio.run(cache.invalidate_dashboard())
+        self.assertEqual(cache._redis.store[cache.DASHBOARD_VERSION_KEY], 1)
+        cache._local.clear()
+        self.assertEqual(self.call(), b'{"count":2}')
+
+    def test_redis_errors_fall_back_to_route(self):
+        cache._redis = FailingRedis()
+        with self.assertLogs(cache.logger, level="WARNING"):
+            self.assertEqual(self.call(), b'{"count":1}')
+            asyncio.run(cache.invalidate_dashboard())
+        self.assertEqual(self.call(), b'{"count":2}')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'real_estate_backend')))  # Add backend root to Python path
+from app.middleware import StaticETagMiddleware
+
+class StaticApp:
+    """ASGI app that returns a fixed body and counts how often it is reached."""
+
+    def __init__(self, body=b'{"status":"healthy"}', status=200):
+        self.body = body
+        self.status = status
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await send({
+            "type": "http.response.start",
+            "status": self.status,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+def get(app, path="/health", if_none_match=None, method="GET"):
+    """Run one request through ``app`` and return (status, headers, body)."""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    scope = {"type": "http", "method": method, "path": path, "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, body = messages
+    return start["status"], dict(start["headers"]), body["body"]
+
+class TestStaticETagMiddleware(unittest.TestCase):
+    def setUp(self):
+        self.inner = StaticApp()
+        self.app = StaticETagMiddleware(self.inner, paths=["/health"], max_age=60)
+
+    def test_adds_weak_etag_and_cache_control(self):
+        status, headers, body = get(self.app)
+        self.assertEqual(status, 200)
+        self.assertEqual(body, self.inner.body)
+        self.assertTrue(headers[b"etag"].startswith(b'W/"'))
+        self.assertEqual(headers[b"cache-control"], b"public, max-age=60")
+
+    def test_matching_etag_returns_304_without_calling_route(self):
+        _, headers, _ = get(self.app)
+        etag = headers[b"etag"].decode()
+        status, headers, body = get(self.app, if_none_match=etag)
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(headers[b"etag"].decode(), etag)
+        self.assertEqual(self.inner.calls, 1)
+
+    def test_strong_form_of_tag_matches(self):
+        _, headers, _ = get(self.app)
+        etag = headers[b"etag"].decode().removeprefix("W/")
+        status, _, _ = get(self.app, if_none_match=f'"other", {etag}')
+        self.assertEqual(status, 304)
+
+    def test_first_request_with_matching_tag_returns_304(self):
+        _, headers, _ = get(StaticETagMiddleware(StaticApp(), paths=["/health"]))
+        status, _, body = get(self.app, if_none_match=headers[b"etag"].decode())
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+    def test_stale_etag_gets_full_response(self):
+        get(self.app)
+        status, headers, body = get(self.app, if_none_match='W/"0000000000000000"')
+        self.assertEqual(status, 200)
+        self.assertEqual(body, self.inner.body)
+        self.assertIn(b"etag", headers)
+        self.assertEqual(self.inner.calls, 2)
+
+    def test_etag_is_computed_once(self):
+        _, first, _ = get(self.app)
+        self.inner.body = b'{"status":"changed"}'
+        _, second, body = get(self.app)
+        self.assertEqual(body, b'{"status":"changed"}')
+        self.assertEqual(first[b"etag"], second[b"etag"])
+
+    def test_other_paths_and_methods_pass_through(self):
+        _, headers, _ = get(self.app, path="/api/v1/deals/")
+        self.assertNotIn(b"etag", headers)
+        _, headers, _ = get(self.app, method="HEAD")
+        self.assertNotIn(b"etag", headers)
+
+    def test_error_responses_are_not_tagged(self):
+        app = StaticETagMiddleware(StaticApp(status=500), paths=["/health"])
+        status, headers, _ = get(app)
+        self.assertEqual(status, 500)
+        self.assertNotIn(b"etag", headers)
+        self.assertEqual(app.etags, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+import base64
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'real_estate_backend')))  # Add backend root to Python path
+from fastapi import HTTPException
+from app.pagination import encode_cursor, decode_cursor
+
+class TestKeysetCursor(unittest.TestCase):
+    def test_round_trip(self):
+        created_at = datetime(2025, 7, 20, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 42)), (created_at, 42))
+
+    def test_round_trip_naive_datetime(self):
+        created_at = datetime(2025, 1, 1)
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 1)), (created_at, 1))
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2025, 7, 20, tzinfo=timezone.utc), 7)
+        self.assertNotIn("+", cursor)
+        self.assertNotIn("/", cursor)
+
+    def assertInvalid(self, cursor):
+        with self.assertRaises(HTTPException) as ctx:
+            decode_cursor(cursor)
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(ctx.exception.detail, "Invalid cursor")
+
+    def test_invalid_base64(self):
+        self.assertInvalid("not base64!")
+
+    def test_invalid_utf8(self):
+        self.assertInvalid(base64.urlsafe_b64encode(b"\xff\xfe").decode())
+
+    def test_missing_separator(self):
+        self.assertInvalid(base64.urlsafe_b64encode(b"2025-07-20T00:00:00").decode())
+
+    def test_too_many_parts(self):
+        self.assertInvalid(base64.urlsafe_b64encode(b"2025-07-20T00:00:00|1|2").decode())
+
+    def test_invalid_timestamp(self):
+        self.assertInvalid(base64.urlsafe_b64encode(b"yesterday|1").decode())
+
+    def test_invalid_id(self):
+        self.assertInvalid(base64.urlsafe_b64encode(b"2025-07-20T00:00:00|abc").decode())
+
+if __name__ == '__main__':
+    unittest.main()